@@ -10,10 +10,20 @@ import mss
 from PIL import Image
 import keyboard
 import threading
+import queue
 import os
+import time
+import argparse
 import tempfile
+import tracemalloc
+from collections import deque
 from datetime import datetime
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # Theme definitions
 THEMES = {
     'Cyber Blue': {
@@ -65,20 +75,266 @@ THEMES = {
 
 THEME_NAMES = list(THEMES.keys())
 
+# Number of translations kept in memory and in the history panel
+MAX_HISTORY = 200
+
+# Maximum UI renders per second from the dispatch queue
+UI_FPS = 20
+
+# Scroll detection settings (auto mode only)
+SCROLL_BANDS = 16  # Vertical bands averaged into each row profile
+SCROLL_MAX_SHIFT = 0.6  # Largest detectable scroll, as a fraction of the height
+SCROLL_ROW_TOLERANCE = 2  # Max gray-level difference in any band for rows to match
+SCROLL_MAX_BAD_ROWS = 0.02  # Fraction of overlap rows allowed to differ in a scroll
+SCROLL_MIN_TEXTURE = 0.1  # Fraction of overlap rows a scroll must match on text, and beat offset 0 by
+SCROLL_MIN_STRIP = 32  # Wait until this many new pixel rows are revealed
+SCROLL_MARGIN = 8  # Extra rows above/below the strip so edge glyphs are whole
+
+# Soak test settings
+SOAK_INTERVAL = 100  # Capture every 100ms against the fake backend
+SOAK_SAMPLE_INTERVAL = 5000  # Sample resources every 5 seconds
+SOAK_WARMUP = 10000  # Baseline is taken after 10 seconds
+SOAK_TOP_ALLOCATORS = 3  # Allocator diffs logged with each sample
+
+# Maximum allowed growth over the baseline before the soak test fails
+SOAK_LIMITS = {
+    'rss_mb': 50,
+    'traced_mb': 20,
+    'open_files': 20,
+    'temp_dir_mb': 5,
+    'threads': 5
+}
+
+FAKE_RESPONSE = """JAPANESE:
+これはソークテストです
+
+ENGLISH:
+This is a soak test"""
+
+
+class UIDispatcher:
+    """Queue of UI updates from worker threads, drained by the Tk loop.
+
+    Workers never touch widgets directly. Pending updates are merged on each
+    frame so only the latest status and one translation render happen, no
+    matter how many updates were posted since the last frame.
+    """
+
+    def __init__(self, root, on_status, on_translations, fps=UI_FPS):
+        self.root = root
+        self.on_status = on_status
+        self.on_translations = on_translations
+        self.interval = 1000 // fps
+        self.queue = queue.Queue()
+        self.root.after(self.interval, self.drain)
+
+    def post_status(self, status):
+        """Queue a status label update (safe from any thread)"""
+        self.queue.put(('status', status))
+
+    def post_translation(self, japanese, english, display=None):
+        """Queue a translation update (safe from any thread).
+
+        The new text goes to the history; display is the (japanese, english)
+        pair for the current translation panel and defaults to the new text.
+        """
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self.queue.put(('translation', (japanese, english, display or (japanese, english), timestamp)))
+
+    def drain(self):
+        """Apply all pending updates as a single render"""
+        status = None
+        translations = []
+        while True:
+            try:
+                kind, payload = self.queue.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'status':
+                status = payload
+            else:
+                translations.append(payload)
+
+        try:
+            if translations:
+                self.on_translations(translations)
+            if status is not None:
+                self.on_status(status)
+        finally:
+            self.root.after(self.interval, self.drain)
+
+
+class ScrollDetector:
+    """Detects scrolling between captures so only new rows get translated.
+
+    Each capture is reduced to a row profile: the mean gray level of every
+    pixel row in a number of vertical bands. A capture is unchanged only if
+    every row matches the last translated capture. It has scrolled if some
+    other offset lines up all but a few rows, and clearly more textured
+    (non-blank) rows than offset 0 does. Translated lines are spread over
+    the rows they were read from, shifted along with the content and
+    dropped once scrolled out or re-read as part of a new strip.
+    """
+
+    def __init__(self):
+        self.region = None
+        self.profile = None
+        self.lines = {'japanese': [], 'english': []}
+
+    def reset(self):
+        """Forget the reference capture and all translated lines"""
+        self.region = None
+        self.profile = None
+        self.lines = {'japanese': [], 'english': []}
+
+    def row_profile(self, img):
+        """Get one tuple of band means per pixel row"""
+        small = img.convert('L').resize((SCROLL_BANDS, img.height), Image.Resampling.BOX)
+        data = small.tobytes()
+        return [data[y * SCROLL_BANDS:(y + 1) * SCROLL_BANDS] for y in range(img.height)]
+
+    def rows_differ(self, a, b):
+        """Check if any band of two profile rows differs beyond the tolerance"""
+        if a == b:
+            return False
+        return any(abs(x - y) > SCROLL_ROW_TOLERANCE for x, y in zip(a, b))
+
+    def textured_rows(self, profile):
+        """Flag rows with content: uneven across bands or unlike the row above.
+
+        Blank rows line up at any offset, so only textured rows count as
+        evidence for a scroll.
+        """
+        flags = []
+        for y, row in enumerate(profile):
+            uneven = max(row) - min(row) > SCROLL_ROW_TOLERANCE
+            flags.append(uneven or (y > 0 and self.rows_differ(row, profile[y - 1])))
+        return flags
+
+    def compare(self, profile, textured, offset, max_bad=None):
+        """Count differing and matching textured rows for new[y] vs old[y + offset].
+
+        Returns (bad, matched), or None once more than max_bad rows differ.
+        """
+        height = len(profile)
+        bad = 0
+        matched = 0
+        for y in range(max(0, -offset), min(height, height - offset)):
+            if self.rows_differ(profile[y], self.profile[y + offset]):
+                bad += 1
+                if max_bad is not None and bad > max_bad:
+                    return None
+            elif textured[y]:
+                matched += 1
+        return bad, matched
+
+    def find_offset(self, profile, textured, bad_at_zero):
+        """Get the scroll offset that clearly beats offset 0, or None"""
+        height = len(profile)
+        best_offset = None
+        best_bad = None
+
+        # Try small scrolls first so they win ties
+        for distance in range(1, int(height * SCROLL_MAX_SHIFT) + 1):
+            overlap = height - distance
+            max_bad = int(overlap * SCROLL_MAX_BAD_ROWS)
+            min_texture = max(1, int(overlap * SCROLL_MIN_TEXTURE))
+            for offset in (distance, -distance):
+                result = self.compare(profile, textured, offset, max_bad)
+                if result is None:
+                    continue
+                bad, matched = result
+                if matched < min_texture or bad_at_zero - bad < min_texture:
+                    continue
+                if best_bad is None or bad < best_bad:
+                    best_offset, best_bad = offset, bad
+            if best_bad == 0:
+                break
+        return best_offset
+
+    def detect(self, img, region):
+        """Compare a capture to the last translated one.
+
+        Returns (change, offset, profile) where change is 'full' (translate
+        the whole capture), 'scroll' (translate only the revealed strip),
+        'same' (skip this capture) or 'pending' (scrolled too little to
+        translate yet).
+        """
+        profile = self.row_profile(img)
+        if self.profile is None or region != self.region:
+            return 'full', 0, profile
+
+        textured = self.textured_rows(profile)
+        bad_at_zero, _ = self.compare(profile, textured, 0)
+        if bad_at_zero == 0:
+            return 'same', 0, profile
+
+        offset = self.find_offset(profile, textured, bad_at_zero)
+        if offset is None:
+            return 'full', 0, profile
+        if abs(offset) < SCROLL_MIN_STRIP:
+            return 'pending', offset, profile
+        return 'scroll', offset, profile
+
+    def strip_box(self, offset, width, height):
+        """Get the crop box of rows revealed by a scroll"""
+        if offset > 0:
+            # Content moved up, new rows at the bottom
+            return (0, max(0, height - offset - SCROLL_MARGIN), width, height)
+        # Content moved down, new rows at the top
+        return (0, 0, width, min(height, -offset + SCROLL_MARGIN))
+
+    def place_lines(self, text, top, bottom):
+        """Spread text lines evenly over rows top-bottom as (center, line)"""
+        lines = [line for line in text.split('\n') if line.strip()]
+        step = (bottom - top) / max(1, len(lines))
+        return [(top + (i + 0.5) * step, line) for i, line in enumerate(lines)]
+
+    def apply(self, change, offset, profile, region, box, japanese, english):
+        """Record a translated capture and get the text to display"""
+        height = len(profile)
+        top, bottom = box[1], box[3]
+
+        for key, text in (('japanese', japanese), ('english', english)):
+            kept = []
+            if change == 'scroll':
+                # Move earlier lines with the content, dropping those that
+                # left the region or were read again as part of the strip
+                for center, line in self.lines[key]:
+                    center -= offset
+                    if 0 <= center < height and not top <= center < bottom:
+                        kept.append((center, line))
+            kept.extend(self.place_lines(text, top, bottom))
+            kept.sort(key=lambda entry: entry[0])
+            self.lines[key] = kept
+
+        self.region = region
+        self.profile = profile
+
+        return (
+            '\n'.join(line for _, line in self.lines['japanese']),
+            '\n'.join(line for _, line in self.lines['english'])
+        )
+
 
 class OCRTranslator:
     """Main application controller"""
 
-    def __init__(self):
+    def __init__(self, translator=None):
         self.temp_dir = tempfile.mkdtemp()
         self.capture_count = 0
         self.is_translating = False
+        self.translate_lock = threading.Lock()
         self.overlay_visible = True
         self.translations = []
+        self.history_line_counts = deque()
         self.auto_mode = False
         self.auto_interval = 5000  # 5 seconds in milliseconds
         self.current_model = 'haiku'  # Default to haiku for speed
         self.current_theme_index = 0  # Start with Cyber Blue
+        self.translator = translator or self.translate_with_claude
+        self.scroll = ScrollDetector()
+        self.scroll_detection = True
 
         # Create main root window (Translation Window)
         self.root = tk.Tk()
@@ -86,6 +342,9 @@ class OCRTranslator:
         self.root.geometry("600x750+950+100")
         self.root.protocol("WM_DELETE_WINDOW", self.quit_app)
 
+        # Capture region, published from the UI thread for workers to read
+        self.region = None
+
         # Create glass overlay as Toplevel
         self.create_glass_overlay()
 
@@ -95,6 +354,9 @@ class OCRTranslator:
         # Apply initial theme
         self.apply_theme()
 
+        # Worker threads post UI updates here instead of calling Tk
+        self.ui = UIDispatcher(self.root, self.update_status, self.update_translations)
+
         # Setup hotkey
         keyboard.add_hotkey('F1', self.capture_and_translate)
         keyboard.add_hotkey('Escape', self.quit_app)
@@ -201,6 +463,10 @@ class OCRTranslator:
         self.overlay_frame.bind('<Button-1>', self.start_resize)
         self.overlay_frame.bind('<B1-Motion>', self.do_resize)
 
+        # Publish the region whenever the overlay moves or resizes
+        self.overlay.bind('<Configure>', self.publish_region)
+        self.root.after_idle(self.publish_region)
+
         # Track position
         self._drag_data = {"x": 0, "y": 0}
         self._resize_data = {"x": 0, "y": 0, "width": 0, "height": 0}
@@ -227,8 +493,13 @@ class OCRTranslator:
         new_height = max(100, self._resize_data["height"] + delta_y)
         self.overlay.geometry(f"{new_width}x{new_height}")
 
+    def publish_region(self, event=None):
+        """Store the overlay geometry for worker threads (UI thread only)"""
+        if event is None or event.widget is self.overlay:
+            self.region = self.get_region()
+
     def get_region(self):
-        """Get the current capture region coordinates"""
+        """Get the current capture region coordinates (UI thread only)"""
         return {
             'left': self.overlay.winfo_x(),
             'top': self.overlay.winfo_y(),
@@ -435,27 +706,38 @@ class OCRTranslator:
         )
         self.history_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-    def update_translation(self, japanese, english):
-        """Update the current translation display"""
-        # Clear previous
-        self.jp_text.delete('1.0', tk.END)
-        self.en_text.delete('1.0', tk.END)
-
-        # Insert new
-        self.jp_text.insert('1.0', japanese)
-        self.en_text.insert('1.0', english)
-
-        # Add to history
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        history_entry = f"[{timestamp}]\nOriginal: {japanese}\nTranslation: {english}\n{'─' * 50}\n\n"
-        self.history_text.insert('1.0', history_entry)
-
-        # Store in list
-        self.translations.append({
-            'time': timestamp,
-            'japanese': japanese,
-            'english': english
-        })
+    def update_translations(self, translations):
+        """Render a batch of translations, oldest first, in one pass"""
+        japanese, english = translations[-1][2]
+
+        # Only rewrite the current display when it changed
+        if self.jp_text.get('1.0', 'end-1c') != japanese:
+            self.jp_text.delete('1.0', tk.END)
+            self.jp_text.insert('1.0', japanese)
+        if self.en_text.get('1.0', 'end-1c') != english:
+            self.en_text.delete('1.0', tk.END)
+            self.en_text.insert('1.0', english)
+
+        # Add to history, newest at the top
+        history_entries = []
+        for japanese, english, _, timestamp in translations:
+            history_entry = f"[{timestamp}]\nOriginal: {japanese}\nTranslation: {english}\n{'─' * 50}\n\n"
+            history_entries.insert(0, history_entry)
+            self.history_line_counts.append(history_entry.count('\n'))
+
+            # Store in list
+            self.translations.append({
+                'time': timestamp,
+                'japanese': japanese,
+                'english': english
+            })
+        self.history_text.insert('1.0', ''.join(history_entries))
+
+        # Drop the oldest entries (at the bottom of the panel) past the limit
+        while len(self.history_line_counts) > MAX_HISTORY:
+            lines = self.history_line_counts.popleft()
+            self.history_text.delete(f"end-1c-{lines}l", 'end-1c')
+        del self.translations[:-MAX_HISTORY]
 
     def update_status(self, status):
         """Update status label"""
@@ -464,6 +746,7 @@ class OCRTranslator:
     def clear_history(self):
         """Clear translation history"""
         self.history_text.delete('1.0', tk.END)
+        self.history_line_counts.clear()
         self.translations = []
 
     def toggle_overlay(self):
@@ -483,6 +766,8 @@ class OCRTranslator:
             self.auto_btn.config(text="Auto: ON", bg=t['success'], fg='black')
             interval_sec = self.auto_interval // 1000
             self.update_status(f"Auto mode ON - capturing every {interval_sec}s")
+            # Start from a full translation of whatever is on screen now
+            self.scroll.reset()
             self.auto_translate_loop()
         else:
             self.auto_btn.config(text="Auto: OFF", bg=t['button'], fg='white')
@@ -500,6 +785,9 @@ class OCRTranslator:
             self.model_btn.config(text="Haiku", bg=t['success'], fg='black')
             self.update_status("Model: Haiku (faster)")
 
+        # Let auto mode re-translate the current screen with the new model
+        self.scroll.reset()
+
     def update_interval(self, value):
         """Update auto-capture interval"""
         seconds = int(value)
@@ -511,7 +799,7 @@ class OCRTranslator:
     def auto_translate_loop(self):
         """Auto-translate loop that runs every 5 seconds"""
         if self.auto_mode and not self.is_translating:
-            self.capture_and_translate()
+            self.capture_and_translate(full=False)
 
         if self.auto_mode:
             self.root.after(self.auto_interval, self.auto_translate_loop)
@@ -522,10 +810,8 @@ class OCRTranslator:
         self.root.destroy()
         os._exit(0)
 
-    def capture_screen(self):
+    def capture_screen(self, region):
         """Capture the region under the glass overlay"""
-        region = self.get_region()
-
         print(f"Capturing region: {region}")
 
         with mss.mss() as sct:
@@ -538,27 +824,28 @@ class OCRTranslator:
             }
             screenshot = sct.grab(monitor)
 
-            # Save to temp file
-            self.capture_count += 1
-            image_path = os.path.join(self.temp_dir, f"capture_{self.capture_count}.jpg")
-
             # Convert to PIL Image
-            img = Image.frombytes('RGB', screenshot.size, screenshot.bgra, 'raw', 'BGRX')
+            return Image.frombytes('RGB', screenshot.size, screenshot.bgra, 'raw', 'BGRX')
+
+    def save_capture(self, img):
+        """Save a capture to the temp dir for the CLI to read"""
+        self.capture_count += 1
+        image_path = os.path.join(self.temp_dir, f"capture_{self.capture_count}.jpg")
 
-            # Optimize: resize if too large (max 1200px width for faster processing)
-            max_width = 1200
-            if img.width > max_width:
-                ratio = max_width / img.width
-                new_size = (max_width, int(img.height * ratio))
-                img = img.resize(new_size, Image.Resampling.LANCZOS)
+        # Optimize: resize if too large (max 1200px width for faster processing)
+        max_width = 1200
+        if img.width > max_width:
+            ratio = max_width / img.width
+            new_size = (max_width, int(img.height * ratio))
+            img = img.resize(new_size, Image.Resampling.LANCZOS)
 
-            # Save as JPEG with quality optimization (smaller file = faster upload)
-            img.save(image_path, 'JPEG', quality=85, optimize=True)
+        # Save as JPEG with quality optimization (smaller file = faster upload)
+        img.save(image_path, 'JPEG', quality=85, optimize=True)
 
-            print(f"Image saved to: {image_path}")
-            print(f"Image size: {img.size}")
+        print(f"Image saved to: {image_path}")
+        print(f"Image size: {img.size}")
 
-            return image_path
+        return image_path
 
     def translate_with_claude(self, image_path):
         """Send image to Claude Code CLI for translation"""
@@ -637,55 +924,81 @@ ENGLISH:
 
         return japanese.strip(), english.strip()
 
-    def capture_and_translate(self):
-        """Main capture and translate workflow"""
-        if self.is_translating:
-            return
+    def capture_and_translate(self, full=True):
+        """Main capture and translate workflow.
 
-        self.is_translating = True
-        self.update_status("Capturing...")
+        full=False (auto mode) skips unchanged captures and only translates
+        newly scrolled-in rows; F1 always translates the whole region.
+        """
+        # Called from both the Tk loop and the hotkey thread
+        with self.translate_lock:
+            if self.region is None:
+                self.ui.post_status("Capture region not ready yet")
+                return
+            if self.is_translating:
+                return
+            self.is_translating = True
+
+        self.ui.post_status("Capturing...")
+
+        use_scroll = not full and self.scroll_detection
+        region = self.region
 
         def do_translation():
+            image_path = None
             try:
                 # Capture screen
-                image_path = self.capture_screen()
-                self.root.after(0, lambda: self.update_status("Translating..."))
+                img = self.capture_screen(region)
+                box = (0, 0, img.width, img.height)
+
+                change, offset, profile = 'full', 0, None
+                if use_scroll:
+                    change, offset, profile = self.scroll.detect(img, region)
+                    if change == 'same':
+                        self.ui.post_status("No new text")
+                        return
+                    if change == 'pending':
+                        self.ui.post_status("Waiting for more scrolled text")
+                        return
+                    if change == 'scroll':
+                        box = self.scroll.strip_box(offset, img.width, img.height)
+                        img = img.crop(box)
+                        print(f"Scrolled {offset}px, translating rows {box[1]}-{box[3]}")
+                elif self.scroll_detection:
+                    # F1 capture becomes the reference for auto mode
+                    profile = self.scroll.row_profile(img)
+
+                image_path = self.save_capture(img)
+                self.ui.post_status("Translating...")
 
                 # Get translation from Claude
-                response = self.translate_with_claude(image_path)
+                response = self.translator(image_path)
 
                 # Parse response
                 japanese, english = self.parse_translation(response)
 
+                display = None
                 if japanese or english:
-                    self.root.after(
-                        0,
-                        lambda: self.update_translation(
-                            japanese or "Could not read text",
-                            english or response
+                    japanese = japanese or "Could not read text"
+                    english = english or response
+                    if profile is not None:
+                        display = self.scroll.apply(
+                            change, offset, profile, region, box, japanese, english
                         )
-                    )
                 else:
-                    # If parsing failed, show raw response
-                    self.root.after(
-                        0,
-                        lambda: self.update_translation(
-                            "See translation below",
-                            response
-                        )
-                    )
+                    # If parsing failed, show raw response and retry in full
+                    japanese, english = "See translation below", response
+                    self.scroll.reset()
+                self.ui.post_translation(japanese, english, display)
 
-                self.root.after(
-                    0,
-                    lambda: self.update_status("Press F1 to capture")
-                )
+                self.ui.post_status("Press F1 to capture")
 
             except Exception as e:
-                self.root.after(
-                    0,
-                    lambda: self.update_status(f"Error: {str(e)}")
-                )
+                self.ui.post_status(f"Error: {str(e)}")
             finally:
+                # Captures are only needed for one translation
+                if image_path and os.path.exists(image_path):
+                    os.remove(image_path)
                 self.is_translating = False
 
         # Run in separate thread to keep UI responsive
@@ -698,12 +1011,210 @@ ENGLISH:
         self.root.mainloop()
 
 
+class ResourceMonitor:
+    """Tracks process resource usage over time and checks it against limits"""
+
+    def __init__(self, temp_dir, limits=None):
+        self.temp_dir = temp_dir
+        self.limits = limits or SOAK_LIMITS
+        self.samples = []
+        self.baseline = None
+        self.baseline_snapshot = None
+        self.process = psutil.Process() if psutil else None
+
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(10)
+
+    def get_rss(self):
+        """Get resident set size in MB, or None if unavailable"""
+        if self.process:
+            return self.process.memory_info().rss / (1024 * 1024)
+        try:
+            with open('/proc/self/statm') as f:
+                pages = int(f.read().split()[1])
+            return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def get_open_files(self):
+        """Get number of open file descriptors (handles on Windows)"""
+        if self.process:
+            if os.name == 'nt':
+                return self.process.num_handles()
+            return self.process.num_fds()
+        try:
+            return len(os.listdir('/proc/self/fd'))
+        except OSError:
+            return None
+
+    def get_temp_dir_size(self):
+        """Get total size of the capture directory in MB"""
+        total = 0
+        for entry in os.scandir(self.temp_dir):
+            try:
+                total += entry.stat().st_size
+            except FileNotFoundError:
+                # Removed by a worker thread while scanning
+                pass
+        return total / (1024 * 1024)
+
+    def sample(self):
+        """Record one resource sample"""
+        traced, _ = tracemalloc.get_traced_memory()
+        sample = {
+            'time': time.monotonic(),
+            'rss_mb': self.get_rss(),
+            'traced_mb': traced / (1024 * 1024),
+            'open_files': self.get_open_files(),
+            'temp_dir_mb': self.get_temp_dir_size(),
+            'threads': threading.active_count()
+        }
+        self.samples.append(sample)
+        return sample
+
+    def set_baseline(self):
+        """Take the sample that later growth is measured against"""
+        self.baseline = self.sample()
+        self.baseline_snapshot = tracemalloc.take_snapshot()
+
+    def growth(self, sample):
+        """Get growth of each metric since the baseline"""
+        result = {}
+        for key in self.limits:
+            if sample[key] is not None and self.baseline[key] is not None:
+                result[key] = sample[key] - self.baseline[key]
+        return result
+
+    def check(self, sample):
+        """Return a list of limit violations for the given sample"""
+        violations = []
+        for key, delta in self.growth(sample).items():
+            if delta > self.limits[key]:
+                violations.append(f"{key} grew by {delta:.1f} (limit {self.limits[key]})")
+        return violations
+
+    def top_allocators(self, limit=10):
+        """Get the source lines whose allocations grew most since the baseline"""
+        snapshot = tracemalloc.take_snapshot()
+        stats = snapshot.compare_to(self.baseline_snapshot, 'lineno')
+        return [str(stat) for stat in stats[:limit]]
+
+    def format_sample(self, sample):
+        """Format a sample as a single log line"""
+        def fmt(value):
+            return "n/a" if value is None else f"{value:.1f}"
+
+        elapsed = sample['time'] - self.samples[0]['time']
+        return (
+            f"[{elapsed:7.1f}s] rss={fmt(sample['rss_mb'])}MB "
+            f"traced={fmt(sample['traced_mb'])}MB "
+            f"files={sample['open_files']} "
+            f"temp={fmt(sample['temp_dir_mb'])}MB "
+            f"threads={sample['threads']}"
+        )
+
+
+class SoakTest:
+    """Drives the app at a high capture rate against a fake backend"""
+
+    def __init__(self, duration, limits=None):
+        self.duration = duration * 1000  # seconds to milliseconds
+        self.app = OCRTranslator(translator=self.fake_translate)
+        self.monitor = ResourceMonitor(self.app.temp_dir, limits)
+        self.started = None
+        self.failures = []
+
+    def fake_translate(self, image_path):
+        """Stand-in for the Claude CLI that returns a canned response"""
+        time.sleep(0.05)
+        return FAKE_RESPONSE
+
+    def start(self):
+        """Switch the app to fast auto mode and start monitoring"""
+        self.started = time.monotonic()
+        self.app.auto_interval = SOAK_INTERVAL
+        # Translate every capture so unchanged screens still load the pipeline
+        self.app.scroll_detection = False
+        self.app.toggle_auto()
+        print(self.monitor.format_sample(self.monitor.sample()))
+        self.app.root.after(SOAK_WARMUP, self.take_baseline)
+
+    def take_baseline(self):
+        """Take the baseline once the app has warmed up"""
+        self.monitor.set_baseline()
+        print("Baseline: " + self.monitor.format_sample(self.monitor.baseline))
+        self.app.root.after(SOAK_SAMPLE_INTERVAL, self.sample_loop)
+
+    def sample_loop(self):
+        """Periodically sample resources and stop on a limit violation"""
+        sample = self.monitor.sample()
+        print(self.monitor.format_sample(sample))
+        for line in self.monitor.top_allocators(SOAK_TOP_ALLOCATORS):
+            print(f"    {line}")
+
+        self.failures = self.monitor.check(sample)
+        elapsed = (time.monotonic() - self.started) * 1000
+        if self.failures or elapsed >= self.duration:
+            self.finish()
+        else:
+            self.app.root.after(SOAK_SAMPLE_INTERVAL, self.sample_loop)
+
+    def finish(self):
+        """Print the report and exit with a failure code on violations"""
+        self.app.auto_mode = False
+
+        print()
+        print(f"Captures: {self.app.capture_count}")
+        print("Top allocators since baseline:")
+        for line in self.monitor.top_allocators():
+            print(f"  {line}")
+        print()
+
+        if self.failures:
+            print("SOAK TEST FAILED")
+            for failure in self.failures:
+                print(f"  {failure}")
+        else:
+            print("SOAK TEST PASSED")
+
+        keyboard.unhook_all()
+        self.app.root.destroy()
+        os._exit(1 if self.failures else 0)
+
+    def run(self):
+        """Start the soak test"""
+        self.app.root.after(0, self.start)
+        self.app.run()
+
+
+def soak_duration(value):
+    """Parse a soak duration, which must cover the warmup and one sample"""
+    seconds = int(value)
+    minimum = (SOAK_WARMUP + SOAK_SAMPLE_INTERVAL) // 1000
+    if seconds < minimum:
+        raise argparse.ArgumentTypeError(f"must be at least {minimum} seconds")
+    return seconds
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR Translator")
+    parser.add_argument(
+        '--soak',
+        type=soak_duration,
+        metavar='SECONDS',
+        help="Run a soak test for SECONDS against a fake backend"
+    )
+    args = parser.parse_args()
+
     print("=" * 50)
     print("  OCR Translator")
     print("  Powered by Claude Code CLI")
     print("=" * 50)
     print()
 
-    app = OCRTranslator()
-    app.run()
+    if args.soak is not None:
+        print(f"Soak test: {args.soak}s at {SOAK_INTERVAL}ms interval")
+        SoakTest(args.soak).run()
+    else:
+        app = OCRTranslator()
+        app.run()
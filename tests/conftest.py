@@ -0,0 +1,14 @@
+import os
+import sys
+import types
+
+# main imports Windows/desktop-only modules at load time; the tests never
+# grab the screen or register hotkeys, so empty stand-ins are enough
+for name in ('mss', 'keyboard'):
+    if name not in sys.modules:
+        try:
+            __import__(name)
+        except ImportError:
+            sys.modules[name] = types.ModuleType(name)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,164 @@
+import threading
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+import main
+from main import ScrollDetector
+
+WIDTH = 400
+HEIGHT = 200
+LINE_HEIGHT = 20
+REGION = {'left': 0, 'top': 0, 'width': WIDTH, 'height': HEIGHT}
+
+
+def make_page(lines=60, line_height=LINE_HEIGHT):
+    """Render a tall page of distinct text lines"""
+    font = ImageFont.load_default(size=16)
+    page = Image.new('RGB', (WIDTH, lines * line_height + HEIGHT), 'white')
+    draw = ImageDraw.Draw(page)
+    for i in range(lines):
+        draw.text((10, i * line_height + 2), f"Line {i}: log entry {i * 7919 % 1000}", fill='black', font=font)
+    return page
+
+
+def window(page, top, height=HEIGHT):
+    return page.crop((0, top, WIDTH, top + height))
+
+
+def detector_with(reference):
+    """Get a detector that has already translated the reference capture"""
+    detector = ScrollDetector()
+    change, offset, profile = detector.detect(reference, REGION)
+    box = (0, 0, reference.width, reference.height)
+    detector.apply(change, offset, profile, REGION, box, 'old', 'old')
+    return detector
+
+
+@pytest.fixture(scope='module')
+def page():
+    return make_page()
+
+
+def test_first_capture_is_full(page):
+    assert ScrollDetector().detect(window(page, 0), REGION)[:2] == ('full', 0)
+
+
+def test_unchanged_capture_is_same(page):
+    detector = detector_with(window(page, 0))
+    assert detector.detect(window(page, 0), REGION)[:2] == ('same', 0)
+
+
+def test_region_change_is_full(page):
+    detector = detector_with(window(page, 0))
+    moved = dict(REGION, left=50)
+    assert detector.detect(window(page, 0), moved)[:2] == ('full', 0)
+
+
+@pytest.mark.parametrize('offset', [40, 80, 100, -40, -80])
+def test_scroll_is_detected(page, offset):
+    detector = detector_with(window(page, 400))
+    assert detector.detect(window(page, 400 + offset), REGION)[:2] == ('scroll', offset)
+
+
+def test_scroll_in_minimum_height_region(page):
+    detector = detector_with(window(page, 400, 100))
+    assert detector.detect(window(page, 440, 100), REGION)[:2] == ('scroll', 40)
+
+
+def test_small_scroll_is_pending(page):
+    detector = detector_with(window(page, 400))
+    assert detector.detect(window(page, 410), REGION)[:2] == ('pending', 10)
+
+
+def test_changed_line_is_full(page):
+    reference = window(page, 0)
+    changed = reference.copy()
+    draw = ImageDraw.Draw(changed)
+    draw.rectangle((0, 3 * LINE_HEIGHT, WIDTH, 4 * LINE_HEIGHT - 1), fill='white')
+    draw.text((10, 3 * LINE_HEIGHT + 2), "HP: 35 Gold: 9999", fill='black',
+              font=ImageFont.load_default(size=16))
+    assert detector_with(reference).detect(changed, REGION)[:2] == ('full', 0)
+
+
+def test_appended_line_is_full():
+    font = ImageFont.load_default(size=16)
+    one = Image.new('RGB', (WIDTH, HEIGHT), 'white')
+    ImageDraw.Draw(one).text((10, 2), "one line", fill='black', font=font)
+    two = one.copy()
+    ImageDraw.Draw(two).text((10, 34), "second line", fill='black', font=font)
+    assert detector_with(one).detect(two, REGION)[:2] == ('full', 0)
+
+
+def test_strip_box():
+    detector = ScrollDetector()
+    margin = main.SCROLL_MARGIN
+    assert detector.strip_box(40, WIDTH, HEIGHT) == (0, HEIGHT - 40 - margin, WIDTH, HEIGHT)
+    assert detector.strip_box(-40, WIDTH, HEIGHT) == (0, 0, WIDTH, 40 + margin)
+    assert detector.strip_box(HEIGHT, WIDTH, HEIGHT) == (0, 0, WIDTH, HEIGHT)
+
+
+def test_apply_shifts_and_drops_lines():
+    detector = ScrollDetector()
+    profile = [b''] * HEIGHT
+    full = (0, 0, WIDTH, HEIGHT)
+    japanese = '\n'.join(f"J{i}" for i in range(10))
+    detector.apply('full', 0, profile, REGION, full, japanese, 'E')
+
+    # Scrolling 60px moves three 20px lines out and reveals J10-J12
+    box = detector.strip_box(60, WIDTH, HEIGHT)
+    japanese, english = detector.apply('scroll', 60, profile, REGION, box, 'J10\nJ11\nJ12', 'E2')
+    assert japanese.split('\n') == [f"J{i}" for i in range(3, 13)]
+    # The single English line sat mid-region and is still on screen
+    assert english.split('\n') == ['E', 'E2']
+
+
+class FakeUI:
+    def __init__(self):
+        self.statuses = []
+        self.translations = []
+
+    def post_status(self, status):
+        self.statuses.append(status)
+
+    def post_translation(self, japanese, english, display=None):
+        self.translations.append((japanese, english, display))
+
+
+class InlineThread:
+    """Runs the worker immediately so the test can inspect its results"""
+
+    def __init__(self, target):
+        self.target = target
+        self.daemon = False
+
+    def start(self):
+        self.target()
+
+
+def test_auto_capture_sends_only_revealed_strip(page, tmp_path, monkeypatch):
+    frames = [window(page, 400), window(page, 440)]
+    sent_sizes = []
+
+    def translator(image_path):
+        sent_sizes.append(Image.open(image_path).size)
+        return "JAPANESE:\nテキスト\n\nENGLISH:\ntext"
+
+    app = main.OCRTranslator.__new__(main.OCRTranslator)
+    app.temp_dir = str(tmp_path)
+    app.capture_count = 0
+    app.is_translating = False
+    app.translate_lock = threading.Lock()
+    app.region = REGION
+    app.translator = translator
+    app.scroll = ScrollDetector()
+    app.scroll_detection = True
+    app.ui = FakeUI()
+    app.capture_screen = lambda region: frames.pop(0)
+    monkeypatch.setattr(main.threading, 'Thread', InlineThread)
+
+    app.capture_and_translate(full=False)
+    app.capture_and_translate(full=False)
+
+    assert sent_sizes == [(WIDTH, HEIGHT), (WIDTH, 40 + main.SCROLL_MARGIN)]
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,43 @@
+import main
+from main import UIDispatcher
+
+
+class FakeRoot:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, delay, callback):
+        self.scheduled.append(callback)
+
+
+class FakeDatetime:
+    times = []
+
+    @classmethod
+    def now(cls):
+        return cls.times.pop(0)
+
+
+def test_drain_merges_updates_with_their_own_timestamps(monkeypatch):
+    import datetime
+    FakeDatetime.times = [datetime.datetime(2026, 1, 1, 12, 0, s) for s in (1, 2)]
+    monkeypatch.setattr(main, 'datetime', FakeDatetime)
+
+    statuses = []
+    renders = []
+    dispatcher = UIDispatcher(FakeRoot(), statuses.append, renders.append)
+    dispatcher.post_status("Capturing...")
+    dispatcher.post_translation('a', 'A')
+    dispatcher.post_status("Translating...")
+    dispatcher.post_translation('b', 'B', display=('ab', 'AB'))
+    dispatcher.drain()
+
+    assert statuses == ["Translating..."]
+    assert renders == [[
+        ('a', 'A', ('a', 'A'), '12:00:01'),
+        ('b', 'B', ('ab', 'AB'), '12:00:02'),
+    ]]
+
+    # Nothing pending renders nothing
+    dispatcher.drain()
+    assert len(renders) == 1